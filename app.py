@@ -1,122 +1,338 @@
 import streamlit as st
 import heapq
+import itertools
+import numpy as np
+from numba import njit
 import os
-import pickle
+import struct
 import base64
-import time
 from datetime import datetime
 import mimetypes
 from pathlib import Path
 
+try:
+    import blosc
+except ImportError:
+    blosc = None
+
 # --------------------------
 # Huffman Coding
 # --------------------------
 
 class Node:
+    __slots__ = ("char", "freq", "left", "right")
+
     def __init__(self, char, freq):
         self.char = char
         self.freq = freq
         self.left = None
         self.right = None
 
-    # Comparison for heap
-    def __lt__(self, other):
-        return self.freq < other.freq
-
 
-def build_frequency_table(data: str):
-    freq = {}
-    for ch in data:
-        freq[ch] = freq.get(ch, 0) + 1
-    return freq
+def build_frequency_table(data: bytes):
+    counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+    return {i: int(c) for i, c in enumerate(counts) if c}
 
 
 def build_huffman_tree(freq):
-    heap = [Node(ch, f) for ch, f in freq.items()]
+    # (freq, tiebreaker, node) tuples compare natively, never reaching Node
+    counter = itertools.count()
+    heap = [(f, next(counter), Node(ch, f)) for ch, f in freq.items()]
     heapq.heapify(heap)
 
     while len(heap) > 1:
-        left = heapq.heappop(heap)
-        right = heapq.heappop(heap)
-        merged = Node(None, left.freq + right.freq)
+        lf, _, left = heapq.heappop(heap)
+        rf, _, right = heapq.heappop(heap)
+        merged = Node(None, lf + rf)
         merged.left = left
         merged.right = right
-        heapq.heappush(heap, merged)
-
-    return heap[0] if heap else None
+        heapq.heappush(heap, (lf + rf, next(counter), merged))
+
+    return heap[0][2] if heap else None
+
+
+def build_code_lengths(root):
+    # only lengths are needed; codewords are reassigned canonically
+    code_lens = np.zeros(256, dtype=np.uint8)
+    stack = [(root, 0)] if root else []
+    while stack:
+        node, depth = stack.pop()
+        if node.char is not None:
+            # a lone symbol still needs one bit per occurrence
+            code_lens[node.char] = max(depth, 1)
+            continue
+        stack.append((node.left, depth + 1))
+        stack.append((node.right, depth + 1))
+    return code_lens
+
+
+def limit_code_lengths(code_lens, freq, max_len):
+    if code_lens.max() <= max_len:
+        return code_lens
+
+    # package-merge: optimal code lengths subject to a max_len cap
+    leaves = sorted((f, (sym,)) for sym, f in freq.items())
+    packages = leaves
+    for _ in range(max_len - 1):
+        paired = [
+            (packages[i][0] + packages[i + 1][0], packages[i][1] + packages[i + 1][1])
+            for i in range(0, len(packages) - 1, 2)
+        ]
+        packages = sorted(leaves + paired, key=lambda item: item[0])
+
+    limited = np.zeros(256, dtype=np.uint8)
+    for _, syms in packages[:2 * len(leaves) - 2]:
+        for sym in syms:
+            limited[sym] += 1
+    return limited
+
+
+def build_canonical_codes(code_lens):
+    # assign consecutive codes to symbols ordered by (length, symbol)
+    code_ints = np.zeros(256, dtype=np.uint32)
+    code = 0
+    prev_len = 0
+    for sym in np.argsort(code_lens, kind="stable"):
+        ln = int(code_lens[sym])
+        if ln == 0:
+            continue
+        code <<= ln - prev_len
+        code_ints[sym] = code
+        code += 1
+        prev_len = ln
+    return code_ints
+
+
+LUT_BITS = 8
+# leading byte of every .huff file
+FORMAT_RAW = 0
+FORMAT_BLOSC = 1
+# Blosc frame header: nbytes (decompressed size) is a little-endian u32 at offset 4
+BLOSC_HEADER_SIZE = 16
+# codes are length-limited so each one fits a uint32 table entry
+MAX_CODE_LEN = 24
+
+
+def build_decode_table(code_lens):
+    code_ints = build_canonical_codes(code_lens)
+    max_len = int(code_lens.max())
+
+    # codes of up to LUT_BITS bits resolve with a single table read
+    table_sym = np.zeros(1 << LUT_BITS, dtype=np.uint8)
+    table_len = np.zeros(1 << LUT_BITS, dtype=np.uint8)
+    for sym in range(256):
+        ln = int(code_lens[sym])
+        if 0 < ln <= LUT_BITS:
+            start = int(code_ints[sym]) << (LUT_BITS - ln)
+            end = start + (1 << (LUT_BITS - ln))
+            table_sym[start:end] = sym
+            table_len[start:end] = ln
+
+    # longer codes are finished bit by bit against the canonical ranges
+    order = np.argsort(code_lens, kind="stable")
+    sorted_syms = order[code_lens[order] > 0].astype(np.uint8)
+    counts = np.bincount(code_lens, minlength=max_len + 1).astype(np.int64)
+    counts[0] = 0
+    offsets = np.zeros(max_len + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)[:-1]
+    first_code = np.zeros(max_len + 1, dtype=np.int64)
+    code = 0
+    for ln in range(1, max_len + 1):
+        code = (code + int(counts[ln - 1])) << 1
+        first_code[ln] = code
+
+    return table_sym, table_len, first_code, counts, offsets, sorted_syms, max_len
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _cached_decode_table(code_lens_key: bytes):
+    # keyed by the raw code-length table; the arrays are only read by _decode
+    return build_decode_table(np.frombuffer(code_lens_key, dtype=np.uint8))
+
+
+@njit(cache=True)
+def _encode(data, code_lens, code_ints, out_buf, start):
+    # out_buf[start] is reserved for the padding count
+    acc = 0
+    nbits = 0
+    pos = start + 1
+    for i in range(len(data)):
+        sym = data[i]
+        ln = code_lens[sym]
+        acc = (acc << ln) | code_ints[sym]
+        nbits += ln
+        while nbits >= 8:
+            nbits -= 8
+            out_buf[pos] = (acc >> nbits) & 0xFF
+            pos += 1
+        acc &= (1 << nbits) - 1
+
+    # pad encoded bits to byte alignment
+    padding = 8 - nbits
+    out_buf[pos] = (acc << padding) & 0xFF
+    out_buf[start] = padding
+    return pos + 1
+
+
+def _prepare_codes(freq):
+    root = build_huffman_tree(freq)
 
+    # per-byte code tables, indexed by symbol value
+    code_lens = limit_code_lengths(build_code_lengths(root), freq, MAX_CODE_LEN)
+    code_ints = build_canonical_codes(code_lens)
 
-def build_codes(node, prefix="", code_map={}):
-    if not node:
-        return
+    # size the output from the frequency table instead of a pass over the input
+    total_bits = sum(f * int(code_lens[sym]) for sym, f in freq.items())
 
-    if node.char is not None:
-        code_map[node.char] = prefix
-        return
+    # header: symbol count, then (symbol, code length) pairs; the canonical
+    # codewords are rebuilt from the lengths on decompression
+    syms = np.flatnonzero(code_lens).astype(np.uint8)
+    pairs = np.column_stack((syms, code_lens[syms]))
+    header = struct.pack("B", syms.size - 1) + pairs.tobytes()
 
-    build_codes(node.left, prefix + "0", code_map)
-    build_codes(node.right, prefix + "1", code_map)
+    return code_lens, code_ints, header, total_bits
 
 
-def huffman_compress(text: str):
-    if not text:
+@st.cache_data(show_spinner=False, max_entries=2, ttl=600)
+def huffman_compress(data: bytes, _codes=None):
+    if not data:
         raise ValueError("Empty input cannot be compressed.")
 
-    freq = build_frequency_table(text)
-    root = build_huffman_tree(freq)
-
-    codes = {}
-    build_codes(root, "", codes)
+    # _codes lets a caller that already built the tables (to report progress)
+    # pass them in; the underscore keeps them out of the cache key
+    if _codes is None:
+        _codes = _prepare_codes(build_frequency_table(data))
+    code_lens, code_ints, header, total_bits = _codes
+    symbols = np.frombuffer(data, dtype=np.uint8)
+
+    # format byte + header + padding byte + payload + (possibly full) padding
+    # tail, written in place so the container is never concatenated
+    start = 1 + len(header)
+    out_buf = np.empty(start + total_bits // 8 + 2, dtype=np.uint8)
+    out_buf[0] = FORMAT_RAW
+    out_buf[1:start] = np.frombuffer(header, dtype=np.uint8)
+    nbytes = _encode(symbols, code_lens, code_ints, out_buf, start)
+
+    # Huffman is order-0 only; a zstd pass often trims the payload further
+    if blosc is not None:
+        container = out_buf[1:nbytes]
+        packed = blosc.compress(container, typesize=1, cname="zstd", clevel=3)
+        if len(packed) < len(container):
+            return bytes([FORMAT_BLOSC]) + packed
+
+    return out_buf[:nbytes].tobytes()
+
+
+@njit(cache=True)
+def _decode(buf, nbits, pos, table_sym, table_len, first_code, counts, offsets,
+            sorted_syms, max_len, out, n):
+    # resumes at bit pos / output index n; stops early once out is full
+    while pos < nbits and n < len(out):
+        # peek the next LUT_BITS bits (zero-filled past the end)
+        i = pos >> 3
+        window = (np.int64(buf[i]) << 8) | buf[i + 1]
+        peek = (window >> (8 - (pos & 7))) & 0xFF
+
+        ln = np.int64(table_len[peek])
+        if ln:
+            if pos + ln > nbits:
+                return pos, -1
+            out[n] = table_sym[peek]
+            pos += ln
+        else:
+            code = peek
+            ln = 8
+            end = pos + 8
+            while True:
+                ln += 1
+                if ln > max_len or end >= nbits:
+                    return pos, -1
+                bit = (buf[end >> 3] >> (7 - (end & 7))) & 1
+                code = (code << 1) | bit
+                end += 1
+                idx = code - first_code[ln]
+                if 0 <= idx < counts[ln]:
+                    out[n] = sorted_syms[offsets[ln] + idx]
+                    break
+            pos = end
+        n += 1
+    return pos, n
 
-    encoded_text = "".join(codes[ch] for ch in text)
 
-    # pad encoded text to byte alignment
-    padding = 8 - len(encoded_text) % 8
-    encoded_text += "0" * padding
-
-    padded_info = "{0:08b}".format(padding)
-    encoded_text = padded_info + encoded_text
+def huffman_decompress(data: bytes):
+    if not data or data[0] not in (FORMAT_RAW, FORMAT_BLOSC):
+        raise ValueError("Corrupted compressed file.")
 
-    # convert to bytes
-    b = bytearray()
-    for i in range(0, len(encoded_text), 8):
-        byte = encoded_text[i:i + 8]
-        b.append(int(byte, 2))
+    if data[0] == FORMAT_BLOSC:
+        if blosc is None:
+            raise ValueError("This file needs the blosc package to decompress.")
 
-    # Store with pickle: compressed data + codes
-    return pickle.dumps((bytes(b), codes))
+        # the container never exceeds its source file by more than the header,
+        # so reject frames claiming more than twice the upload limit before
+        # blosc allocates the output from the untrusted size field
+        if len(data) < 1 + BLOSC_HEADER_SIZE:
+            raise ValueError("Corrupted compressed file.")
+        nbytes = struct.unpack_from("<I", data, 1 + 4)[0]
+        if nbytes > 2 * st.get_option("server.maxUploadSize") * 1024 * 1024:
+            raise ValueError("Corrupted compressed file.")
 
+        try:
+            data = blosc.decompress(memoryview(data)[1:])
+        except Exception:
+            raise ValueError("Corrupted compressed file.")
+    else:
+        data = memoryview(data)[1:]
 
-def huffman_decompress(data: bytes):
     try:
-        b, codes = pickle.loads(data)
-    except Exception as e:
+        nsymbols = data[0] + 1
+        pairs = np.frombuffer(data, dtype=np.uint8, count=2 * nsymbols, offset=1)
+    except (IndexError, ValueError):
         raise ValueError("Corrupted compressed file.")
+    start = 1 + 2 * nsymbols
 
-    # reverse map
-    rev_codes = {v: k for k, v in codes.items()}
+    code_lens = np.zeros(256, dtype=np.uint8)
+    code_lens[pairs[0::2]] = pairs[1::2]
 
-    bit_string = ""
-    for byte in b:
-        bit_string += "{0:08b}".format(byte)
+    # lengths that over-subscribe the code space cannot come from a Huffman tree
+    max_len = int(code_lens.max())
+    if max_len > MAX_CODE_LEN:
+        raise ValueError("Corrupted compressed file.")
+    if sum(1 << (max_len - int(ln)) for ln in code_lens if ln) > 1 << max_len:
+        raise ValueError("Corrupted compressed file.")
+
+    if start >= len(data) or data[start] > 8:
+        raise ValueError("Corrupted compressed file.")
 
     # remove padding
-    padding = int(bit_string[:8], 2)
-    bit_string = bit_string[8:]
-    bit_string = bit_string[:-padding] if padding > 0 else bit_string
-
-    decoded_text = ""
-    code = ""
-    for bit in bit_string:
-        code += bit
-        if code in rev_codes:
-            decoded_text += rev_codes[code]
-            code = ""
-
-    if code != "":
+    payload = np.frombuffer(data, dtype=np.uint8, offset=start + 1)
+    nbits = payload.size * 8 - data[start]
+
+    # one spare zero byte lets the decoder peek past the final bit
+    buf = np.zeros(payload.size + 1, dtype=np.uint8)
+    buf[:-1] = payload
+
+    used_lens = code_lens[code_lens > 0].astype(np.float64)
+    if not used_lens.size:
+        raise ValueError("Corrupted compressed file.")
+
+    # only headers that passed validation reach the shared table cache
+    table = _cached_decode_table(code_lens.tobytes())
+
+    # size the output from the expected bits per symbol implied by the code
+    # lengths; if that falls short, grow once to the worst-case bound
+    weights = 2.0 ** -used_lens
+    avg_len = float((used_lens * weights).sum() / weights.sum())
+    out = np.empty(int(max(nbits, 0) / avg_len) + 64, dtype=np.uint8)
+    pos, n = _decode(buf, nbits, 0, *table, out, 0)
+    if 0 <= n and pos < nbits:
+        grown = np.empty(n + (nbits - pos) // int(used_lens.min()) + 1, dtype=np.uint8)
+        grown[:n] = out[:n]
+        out = grown
+        pos, n = _decode(buf, nbits, pos, *table, out, n)
+    if n < 0:
         raise ValueError("Incomplete prefix code in compressed file.")
 
-    return decoded_text
+    return out[:n].tobytes()
 
 
 # --------------------------
@@ -173,213 +389,11 @@ st.set_page_config(
 )
 
 # Custom CSS for premium styling
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Main app styling */
-    .main .block-container {
-        padding-top: 0.5rem;
-        padding-bottom: 0.5rem;
-        max-width: 1200px;
-        height: 100vh;
-        overflow: hidden !important;
-    }
-    
-    /* Prevent all scrolling */
-    .main {
-        overflow: hidden !important;
-        height: 100vh !important;
-    }
-    
-    /* Force no scroll on body */
-    body {
-        overflow: hidden !important;
-    }
-    
-    /* Header styling */
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        margin-bottom: 0.5rem;
-        text-align: center;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    
-    .main-header h1 {
-        color: white !important;
-        font-family: 'Inter', sans-serif;
-        font-weight: 700;
-        font-size: 1.8rem;
-        margin: 0;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .main-header p {
-        color: rgba(255,255,255,0.9) !important;
-        font-size: 0.9rem;
-        margin: 0.2rem 0 0 0;
-        font-weight: 400;
-    }
-    
-    /* Card styling */
-    .premium-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        margin-bottom: 0.5rem;
-        border: 1px solid rgba(255,255,255,0.2);
-    }
-    
-    .stats-card {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    
-    .stats-number {
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0;
-    }
-    
-    .stats-label {
-        font-size: 0.9rem;
-        opacity: 0.9;
-        margin: 0;
-    }
-    
-    /* File upload area */
-    .stFileUploader > div > div {
-        border: 2px dashed #667eea !important;
-        border-radius: 15px !important;
-        background: linear-gradient(135deg, #f8f9ff 0%, #e8ecff 100%) !important;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 10px !important;
-        padding: 0.75rem 2rem !important;
-        font-weight: 600 !important;
-        font-size: 1.1rem !important;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4) !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.6) !important;
-    }
-    
-    /* Download button */
-    .download-btn {
-        background: linear-gradient(135deg, #56ab2f 0%, #a8e6cf 100%) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 10px !important;
-        padding: 0.75rem 2rem !important;
-        font-weight: 600 !important;
-        box-shadow: 0 4px 15px rgba(86, 171, 47, 0.4) !important;
-    }
-    
-    /* Radio button styling */
-    .stRadio > div {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    
-    /* Success/Error message styling */
-    .stSuccess {
-        background: linear-gradient(135deg, #56ab2f 0%, #a8e6cf 100%) !important;
-        color: white !important;
-        border-radius: 10px !important;
-        padding: 1rem !important;
-    }
-    
-    .stError {
-        background: linear-gradient(135deg, #ff416c 0%, #ff4b2b 100%) !important;
-        color: white !important;
-        border-radius: 10px !important;
-        padding: 1rem !important;
-    }
-    
-    .stWarning {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%) !important;
-        color: white !important;
-        border-radius: 10px !important;
-        padding: 1rem !important;
-    }
-    
-    /* Progress bar */
-    .stProgress > div > div > div > div {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background: linear-gradient(180deg, #667eea 0%, #764ba2 100%) !important;
-    }
-    
-    /* File info display */
-    .file-info {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        text-align: center;
-    }
-    
-    .file-icon {
-        font-size: 2rem;
-        margin-bottom: 0.3rem;
-    }
-    
-    .file-name {
-        font-size: 1.1rem;
-        font-weight: 600;
-        margin: 0.3rem 0;
-    }
-    
-    .file-details {
-        font-size: 0.8rem;
-        opacity: 0.9;
-        margin: 0.1rem 0;
-    }
-    
-    /* Hide streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Remove all default spacing and margins */
-    .stApp > div {
-        padding: 0 !important;
-        margin: 0 !important;
-    }
-    
-    /* Compact spacing for all elements */
-    .stMarkdown, .stFileUploader, .stRadio, .stButton {
-        margin-bottom: 0.5rem !important;
-    }
-    
-    /* Ensure no overflow on any container */
-    * {
-        box-sizing: border-box;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _css():
+    return (Path(__file__).parent / "style.css").read_text()
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 # Main header
 st.markdown("""
@@ -430,7 +444,7 @@ with col1:
     uploaded_file = st.file_uploader(
         "Choose a file to compress or decompress",
         type=None,
-        help="Upload any text file for compression or .huff file for decompression"
+        help="Upload any file for compression or .huff file for decompression"
     )
     
     # Operation mode
@@ -452,23 +466,9 @@ with col2:
     st.markdown(f"**Session Time:** {datetime.now().strftime('%H:%M:%S')}")
     st.markdown('</div>', unsafe_allow_html=True)
 
-# File processing section
-if uploaded_file:
-    # File information display
-    file_icon = get_file_icon(uploaded_file.name)
-    file_size = format_file_size(uploaded_file.size)
-    file_type = get_file_type_description(uploaded_file.name)
-    
-    st.markdown(f"""
-    <div class="file-info">
-        <div class="file-icon">{file_icon}</div>
-        <div class="file-name">{uploaded_file.name}</div>
-        <div class="file-details">Size: {file_size}</div>
-        <div class="file-details">Type: {file_type}</div>
-        <div class="file-details">Uploaded: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
+# Only the processing section reruns when its button is pressed
+@st.fragment
+def process_file(uploaded_file, mode):
     # Process button
     if st.button("🚀 Process File", use_container_width=True):
         # Create progress bar
@@ -476,67 +476,63 @@ if uploaded_file:
         status_text = st.empty()
         
         try:
-            input_bytes = uploaded_file.read()
+            input_bytes = uploaded_file.getvalue()
 
             if len(input_bytes) == 0:
                 st.error("❌ The uploaded file is empty!")
             else:
                 # Update progress
                 progress_bar.progress(25)
-                status_text.text("📖 Reading file...")
-                time.sleep(0.5)
                 
                 if "Compress" in mode:
-                    progress_bar.progress(50)
+                    status_text.text("📊 Counting byte frequencies...")
+                    freq = build_frequency_table(input_bytes)
+                    progress_bar.progress(40)
+
+                    status_text.text("🌳 Building Huffman codes...")
+                    codes = _prepare_codes(freq)
+                    progress_bar.progress(60)
+
                     status_text.text("🗜️ Compressing with Huffman algorithm...")
+                    compressed = huffman_compress(input_bytes, _codes=codes)
+                    compressed_size = len(compressed)
+                    original_size = len(input_bytes)
+                    compression_ratio = calculate_compression_ratio(original_size, compressed_size)
                     
-                    try:
-                        text = input_bytes.decode("utf-8")
-                    except Exception:
-                        st.error("❌ Only UTF-8 text files are supported for compression.")
-                        text = None
-
-                    if text:
-                        compressed = huffman_compress(text)
-                        compressed_size = len(compressed)
-                        original_size = len(input_bytes)
-                        compression_ratio = calculate_compression_ratio(original_size, compressed_size)
-                        
-                        progress_bar.progress(100)
-                        status_text.text("✅ Compression completed!")
-                        time.sleep(0.5)
-                        
-                        # Update session stats
-                        st.session_state.total_compressed += 1
-                        st.session_state.total_saved += (original_size - compressed_size) / 1024
-                        
-                        # Success message with stats
-                        st.success(f"🎉 **Compression Successful!**")
-                        
-                        # Display compression statistics
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.metric("Original Size", format_file_size(original_size))
-                        with col2:
-                            st.metric("Compressed Size", format_file_size(compressed_size))
-                        with col3:
-                            st.metric("Compression Ratio", f"{compression_ratio:.1f}%")
-                        with col4:
-                            st.metric("Space Saved", format_file_size(original_size - compressed_size))
-                        
-                        # Download button
-                        out_name = uploaded_file.name + ".huff"
-                        st.download_button(
-                            label="💾 Download Compressed File",
-                            data=compressed,
-                            file_name=out_name,
-                            mime="application/octet-stream",
-                            use_container_width=True
-                        )
-                        
-                        # Clear progress
-                        progress_bar.empty()
-                        status_text.empty()
+                    progress_bar.progress(100)
+                    status_text.text("✅ Compression completed!")
+                    
+                    # Update session stats
+                    st.session_state.total_compressed += 1
+                    st.session_state.total_saved += (original_size - compressed_size) / 1024
+                    
+                    # Success message with stats
+                    st.success(f"🎉 **Compression Successful!**")
+                    
+                    # Display compression statistics
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("Original Size", format_file_size(original_size))
+                    with col2:
+                        st.metric("Compressed Size", format_file_size(compressed_size))
+                    with col3:
+                        st.metric("Compression Ratio", f"{compression_ratio:.1f}%")
+                    with col4:
+                        st.metric("Space Saved", format_file_size(original_size - compressed_size))
+                    
+                    # Download button
+                    out_name = uploaded_file.name + ".huff"
+                    st.download_button(
+                        label="💾 Download Compressed File",
+                        data=compressed,
+                        file_name=out_name,
+                        mime="application/octet-stream",
+                        use_container_width=True
+                    )
+                    
+                    # Clear progress
+                    progress_bar.empty()
+                    status_text.empty()
 
                 else:  # Decompress
                     progress_bar.progress(50)
@@ -544,12 +540,11 @@ if uploaded_file:
                     
                     try:
                         decompressed = huffman_decompress(input_bytes)
-                        decompressed_size = len(decompressed.encode('utf-8'))
+                        decompressed_size = len(decompressed)
                         original_size = len(input_bytes)
                         
                         progress_bar.progress(100)
                         status_text.text("✅ Decompression completed!")
-                        time.sleep(0.5)
                         
                         # Success message
                         st.success(f"🎉 **Decompression Successful!**")
@@ -565,12 +560,14 @@ if uploaded_file:
                             st.metric("Expansion Ratio", f"{expansion_ratio:.1f}%")
                         
                         # Download button
-                        out_name = uploaded_file.name.replace(".huff", "_decompressed.txt")
+                        original_name = Path(uploaded_file.name.removesuffix(".huff"))
+                        out_name = f"{original_name.stem}_decompressed{original_name.suffix}"
+                        out_mime = mimetypes.guess_type(out_name)[0] or "application/octet-stream"
                         st.download_button(
                             label="💾 Download Decompressed File",
-                            data=decompressed.encode("utf-8"),
+                            data=decompressed,
                             file_name=out_name,
-                            mime="text/plain",
+                            mime=out_mime,
                             use_container_width=True
                         )
                         
@@ -589,4 +586,21 @@ if uploaded_file:
             st.error(f"⚠️ **Unexpected Error:** {str(e)}")
 
 
+# File processing section
+if uploaded_file:
+    # File information display
+    file_icon = get_file_icon(uploaded_file.name)
+    file_size = format_file_size(uploaded_file.size)
+    file_type = get_file_type_description(uploaded_file.name)
+    
+    st.markdown(f"""
+    <div class="file-info">
+        <div class="file-icon">{file_icon}</div>
+        <div class="file-name">{uploaded_file.name}</div>
+        <div class="file-details">Size: {file_size}</div>
+        <div class="file-details">Type: {file_type}</div>
+        <div class="file-details">Uploaded: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
+    </div>
+    """, unsafe_allow_html=True)
 
+    process_file(uploaded_file, mode)